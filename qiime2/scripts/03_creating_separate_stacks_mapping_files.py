@@ -6,35 +6,28 @@ Input: TSV file with sample metadata and tag sequences: stacks_sample_mapping_al
 Output: Individual TSV files for each sublibrary (48 files)
 """
 
+import logging
 import os
+import sys
+from collections import defaultdict
 
-def create_mapping_files(input_file, output_dir):
+logger = logging.getLogger(__name__)
+
+def create_mapping_files(input_file, output_dir, verbose=False):
     """
     Read TSV file and create individual mapping files for each sublibrary
     
     Parameters:
     input_file (str): Path to TSV file with my data
     output_dir (str): Directory to save the mapping files
-    """
-    
-    print(f" Reading file: {input_file}")
-    
-    # Read the TSV file
-    try:
-        with open(input_file, 'r') as file:
-            lines = file.readlines()
-    except FileNotFoundError:
-        print(f" File not found: {input_file}")
-        return
+    verbose (bool): Also log per-sublibrary details and example entries
     
-    print(f" Read {len(lines)} lines from file")
-    
-    # Remove header line and empty lines
-    header = lines[0].strip().split('\t')
-    data_lines = [line.strip() for line in lines[1:] if line.strip()]
+    Status messages go to this module's logger at INFO level. main() sends them to stdout;
+    when calling this function from elsewhere, configure logging first (e.g. logging.basicConfig)
+    or the messages will not be shown.
+    """
     
-    print(f" Header columns: {header}")
-    print(f" Data rows: {len(data_lines)}")
+    logger.info(f" Reading file: {input_file}")
     
     # Column positions based on TSV file:
     # 0=sample-id, 1=sublibrary_id, 2=16s_forward_primer, 3=16s_forward_primer_tag, 
@@ -47,52 +40,69 @@ def create_mapping_files(input_file, output_dir):
     ITS1_FORWARD_TAG = 7    # its1_forward_primer_tag
     ITS1_REVERSE_TAG = 9    # its1_reverse_primer_tag
     
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    print(f" Output directory: {output_dir}")
-    
     # Group data by sublibrary
-    sublibraries = {}
+    sublibraries = defaultdict(list)
+    data_row_count = 0
     
-    for line in data_lines:
-        columns = line.split('\t')
-        
-        # Skip lines that don't have enough columns
-        if len(columns) < 10:
-            print(f" Skipping line (not enough columns): {line[:50]}...")
-            continue
-        
-        sample_id = columns[SAMPLE_ID]
-        sublibrary_id = columns[SUBLIBRARY_ID]
-        
-        # Skip empty rows
-        if not sample_id or not sublibrary_id:
-            continue
-        
-        # Add to sublibrary group
-        if sublibrary_id not in sublibraries:
-            sublibraries[sublibrary_id] = []
-        
-        # Get tag sequences
-        s16_forward = columns[S16_FORWARD_TAG]
-        s16_reverse = columns[S16_REVERSE_TAG]
-        its1_forward = columns[ITS1_FORWARD_TAG]
-        its1_reverse = columns[ITS1_REVERSE_TAG]
-        
-        # Add both 16S and ITS1 entries for this sample
-        sublibraries[sublibrary_id].append({
-            'forward_tag': s16_forward,
-            'reverse_tag': s16_reverse,
-            'sample_name': f"{sample_id}_16S"
-        })
-        
-        sublibraries[sublibrary_id].append({
-            'forward_tag': its1_forward,
-            'reverse_tag': its1_reverse,
-            'sample_name': f"{sample_id}_ITS1"
-        })
+    # Read the TSV file line by line rather than loading it into memory
+    try:
+        with open(input_file, 'r') as file:
+            header_line = next(file, None)
+            if header_line is None:
+                logger.error(f" File is empty: {input_file}")
+                return
+            header = header_line.strip().split('\t')
+            
+            lines_read = 1
+            for line in file:
+                lines_read += 1
+                
+                # Skip empty lines
+                line = line.strip()
+                if not line:
+                    continue
+                data_row_count += 1
+                
+                columns = line.split('\t')
+                
+                # Skip lines that don't have enough columns
+                if len(columns) < 10:
+                    logger.warning(f" Skipping line (not enough columns): {line[:50]}...")
+                    continue
+                
+                sample_id = columns[SAMPLE_ID]
+                sublibrary_id = columns[SUBLIBRARY_ID]
+                
+                # Skip empty rows
+                if not sample_id or not sublibrary_id:
+                    continue
+                
+                # Get tag sequences
+                s16_forward = columns[S16_FORWARD_TAG]
+                s16_reverse = columns[S16_REVERSE_TAG]
+                its1_forward = columns[ITS1_FORWARD_TAG]
+                its1_reverse = columns[ITS1_REVERSE_TAG]
+                
+                # Add both 16S and ITS1 entries for this sample to its sublibrary group
+                # as (forward_tag, reverse_tag, sample_name)
+                sublibraries[sublibrary_id].extend((
+                    (s16_forward, s16_reverse, f"{sample_id}_16S"),
+                    (its1_forward, its1_reverse, f"{sample_id}_ITS1"),
+                ))
+    except FileNotFoundError:
+        logger.error(f" File not found: {input_file}")
+        return
     
-    print(f" Found {len(sublibraries)} unique sublibraries")
+    # Counts are only known after the single pass, so the summary is logged here
+    logger.info(f" Read {lines_read} lines from file")
+    logger.info(f" Header columns: {header}")
+    logger.info(f" Data rows: {data_row_count}")
+    
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info(f" Output directory: {output_dir}")
+    
+    logger.info(f" Found {len(sublibraries)} unique sublibraries")
     
     # Create mapping file for each sublibrary
     files_created = 0
@@ -100,29 +110,28 @@ def create_mapping_files(input_file, output_dir):
     for sublibrary_id in sorted(sublibraries.keys()):  # Sort for consistent output
         samples = sublibraries[sublibrary_id]
         
-        print(f"\n Processing sublibrary: {sublibrary_id}")
-        print(f"   Samples: {len(samples)//2} ({len(samples)} tag combinations)")
-        
         # Create output file
         output_file = os.path.join(output_dir, f"{sublibrary_id}_tags.tsv")
         
         with open(output_file, 'w') as file:
-            for sample in samples:
-                # Write in Stacks format: forward_tag\treverse_tag\tsample_name
-                file.write(f"{sample['forward_tag']}\t{sample['reverse_tag']}\t{sample['sample_name']}\n")
-        
-        print(f" Created: {output_file}")
+            # Write in Stacks format: forward_tag\treverse_tag\tsample_name
+            file.write("".join(f"{forward_tag}\t{reverse_tag}\t{sample_name}\n"
+                               for forward_tag, reverse_tag, sample_name in samples))
         
-        # Show first few lines as example
-        print(f" Example entries:")
-        for i, sample in enumerate(samples[:4]):  # Show first 4 entries
-            print(f"      {sample['forward_tag']}\t{sample['reverse_tag']}\t{sample['sample_name']}")
+        # Show sublibrary details and first few lines as example
+        if verbose:
+            examples = "".join(f"\n      {forward_tag}\t{reverse_tag}\t{sample_name}"
+                               for forward_tag, reverse_tag, sample_name in samples[:4])  # Show first 4 entries
+            logger.info(f"\n Processing sublibrary: {sublibrary_id}"
+                        f"\n   Samples: {len(samples)//2} ({len(samples)} tag combinations)"
+                        f"\n Created: {output_file}"
+                        f"\n Example entries:{examples}")
         
         files_created += 1
     
-    print(f"\n Process complete!")
-    print(f" Created {files_created} mapping files")
-    print(f" Ready for Stacks process_radtags!")
+    logger.info(f"\n Process complete!")
+    logger.info(f" Created {files_created} mapping files")
+    logger.info(f" Ready for Stacks process_radtags!")
 
 def main():
     """
@@ -135,8 +144,14 @@ def main():
     # OUTPUT: Directory for mapping files  
     output_dir = "qiime2/import/demux/internal_tag_mappings"
     
+    # VERBOSE: Set to True to print per-sublibrary details and example entries
+    verbose = False
+    
+    # Log to stdout in the same plain format as before
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Create the mapping files
-    create_mapping_files(input_file, output_dir)
+    create_mapping_files(input_file, output_dir, verbose=verbose)
 
 if __name__ == "__main__":
     main()